@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import logging
 import os
 import re
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any
@@ -31,14 +33,17 @@
 
 MAX_ROWS = 1000
 STATEMENT_TIMEOUT_MS = 3000
+CONNECT_TIMEOUT_S = 5
+APPLICATION_NAME = "aden-tools"
 
 MIN_POOL_SIZE = 1
 MAX_POOL_SIZE = 10
+MAX_CACHED_POOLS = 16
 
 
 logger = logging.getLogger(__name__)
-_connection_pool: pool.ThreadedConnectionPool | None = None
-_pool_database_url: str | None = None
+_connection_pools: dict[str, pool.ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
 
 
 # ============================================================
@@ -111,12 +116,39 @@ def validate_sql(sql: str) -> str:
 # ============================================================
 
 
+def _default_connect_options(database_url: str) -> dict[str, Any]:
+    """
+    Return connection options to apply on top of the database URL.
+
+    psycopg2 lets keyword arguments override values already present in the
+    DSN, so the defaults are only returned for keys the URL does not set.
+
+    Args:
+        database_url: PostgreSQL database URL
+
+    Returns:
+        A dict of keyword arguments for psycopg2.connect
+    """
+    dsn_options = psycopg.extensions.parse_dsn(database_url)
+    defaults = {
+        "connect_timeout": CONNECT_TIMEOUT_S,
+        "application_name": APPLICATION_NAME,
+    }
+    return {key: value for key, value in defaults.items() if key not in dsn_options}
+
+
 def _get_pool(database_url: str):
     """
     Retrieve a connection pool for the given PostgreSQL database URL.
 
-    This function lazily creates a connection pool when the first request is made.
-    Subsequent requests will reuse the existing connection pool.
+    Pools are created lazily and cached per database URL, so alternating
+    between databases reuses existing pools instead of rebuilding them. The
+    cache is LRU-ordered: once MAX_CACHED_POOLS URLs are cached, the least
+    recently used pool is closed and evicted. Closing a pool also closes any
+    of its connections that are still checked out.
+
+    The pool is built outside the cache lock, so a slow or unreachable URL
+    does not block callers whose pool is already cached.
 
     Args:
         database_url: PostgreSQL database URL
@@ -124,15 +156,45 @@ def _get_pool(database_url: str):
     Returns:
         A connection pool object
     """
-    global _connection_pool, _pool_database_url
-    if _connection_pool is None or _pool_database_url != database_url:
-        if _connection_pool is not None:
-            _connection_pool.closeall()
-        _connection_pool = pool.ThreadedConnectionPool(
-            MIN_POOL_SIZE, MAX_POOL_SIZE, dsn=database_url
-        )
-        _pool_database_url = database_url
-    return _connection_pool
+    with _pools_lock:
+        pool_instance = _connection_pools.pop(database_url, None)
+        if pool_instance is not None:
+            _connection_pools[database_url] = pool_instance
+            return pool_instance
+
+    new_pool = pool.ThreadedConnectionPool(
+        MIN_POOL_SIZE,
+        MAX_POOL_SIZE,
+        dsn=database_url,
+        **_default_connect_options(database_url),
+    )
+
+    evicted: list[pool.ThreadedConnectionPool] = []
+    with _pools_lock:
+        pool_instance = _connection_pools.pop(database_url, None)
+        if pool_instance is None:
+            pool_instance = new_pool
+            while len(_connection_pools) >= MAX_CACHED_POOLS:
+                lru_url = next(iter(_connection_pools))
+                evicted.append(_connection_pools.pop(lru_url))
+        else:
+            # Another thread cached a pool for this URL while we were connecting
+            evicted.append(new_pool)
+        _connection_pools[database_url] = pool_instance
+
+    for stale_pool in evicted:
+        stale_pool.closeall()
+
+    return pool_instance
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Close every cached connection pool on interpreter shutdown."""
+    with _pools_lock:
+        for pool_instance in _connection_pools.values():
+            pool_instance.closeall()
+        _connection_pools.clear()
 
 
 @contextmanager
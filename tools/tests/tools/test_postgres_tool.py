@@ -253,3 +253,90 @@ def test_explain_invalid_sql(self, pg_explain_fn, monkeypatch):
 
         assert result["success"] is False
         assert "error" in result
+
+
+class FakePool:
+    def __init__(self, minconn, maxconn, dsn, **kwargs):
+        self.dsn = dsn
+        self.kwargs = kwargs
+        self.closed = False
+
+    def closeall(self):
+        self.closed = True
+
+
+@pytest.fixture
+def postgres_module(monkeypatch):
+    from aden_tools.tools.postgres_tool import postgres_tool
+
+    monkeypatch.setattr(postgres_tool.pool, "ThreadedConnectionPool", FakePool)
+    monkeypatch.setattr(postgres_tool, "_connection_pools", {})
+    return postgres_tool
+
+
+class TestGetPool:
+    def test_pools_are_cached_per_database_url(self, postgres_module):
+        first = postgres_module._get_pool("postgresql://db-a")
+        second = postgres_module._get_pool("postgresql://db-b")
+
+        assert postgres_module._get_pool("postgresql://db-a") is first
+        assert first is not second
+        assert len(postgres_module._connection_pools) == 2
+        assert not first.closed
+
+        assert first.kwargs["connect_timeout"] == postgres_module.CONNECT_TIMEOUT_S
+        assert first.kwargs["application_name"] == postgres_module.APPLICATION_NAME
+
+    def test_connect_options_in_url_are_kept(self, postgres_module):
+        url = "postgresql://db-a/app?connect_timeout=30&application_name=myservice"
+
+        created = postgres_module._get_pool(url)
+        effective = psycopg.extensions.parse_dsn(
+            psycopg.extensions.make_dsn(created.dsn, **created.kwargs)
+        )
+
+        assert effective["connect_timeout"] == "30"
+        assert effective["application_name"] == "myservice"
+
+    def test_least_recently_used_pool_is_evicted(self, postgres_module, monkeypatch):
+        monkeypatch.setattr(postgres_module, "MAX_CACHED_POOLS", 2)
+
+        pool_a = postgres_module._get_pool("postgresql://db-a")
+        pool_b = postgres_module._get_pool("postgresql://db-b")
+        # Touch db-a so db-b becomes the least recently used entry
+        postgres_module._get_pool("postgresql://db-a")
+        pool_c = postgres_module._get_pool("postgresql://db-c")
+
+        assert pool_b.closed
+        assert not pool_a.closed
+        assert not pool_c.closed
+        assert list(postgres_module._connection_pools) == [
+            "postgresql://db-a",
+            "postgresql://db-c",
+        ]
+
+    def test_close_pools_closes_everything(self, postgres_module):
+        pools = [
+            postgres_module._get_pool("postgresql://db-a"),
+            postgres_module._get_pool("postgresql://db-b"),
+        ]
+
+        postgres_module._close_pools()
+
+        assert all(p.closed for p in pools)
+        assert postgres_module._connection_pools == {}
+
+    def test_failed_connect_does_not_evict(self, postgres_module, monkeypatch):
+        monkeypatch.setattr(postgres_module, "MAX_CACHED_POOLS", 1)
+        healthy = postgres_module._get_pool("postgresql://db-a")
+
+        def failing_pool(*args, **kwargs):
+            raise psycopg.OperationalError("connection refused")
+
+        monkeypatch.setattr(postgres_module.pool, "ThreadedConnectionPool", failing_pool)
+
+        with pytest.raises(psycopg.OperationalError):
+            postgres_module._get_pool("postgresql://unreachable")
+
+        assert not healthy.closed
+        assert postgres_module._connection_pools == {"postgresql://db-a": healthy}